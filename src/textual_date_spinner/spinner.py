@@ -1,7 +1,6 @@
 import re
-from calendar import monthrange
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, MINYEAR, MAXYEAR
 from typing import Union, NamedTuple, Literal, Optional
 
 from textual import on
@@ -10,9 +9,38 @@ from textual.containers import Grid, Horizontal
 from textual.events import DescendantBlur
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Label, Button, Input
 
+# Seconds of typing inactivity before BasicDatePicker re-applies the day constraint. This needs to span the gap
+# between keystrokes (typically 100-200ms); leaving the input still validates straight away.
+_VALIDATE_DELAY = 0.4
+
+_NON_DIGIT = re.compile(r"\D+")
+# Deletion table for the characters realistically typed or pasted; anything outside it falls back to _NON_DIGIT.
+_STRIP_NON_DIGIT = {c: None for c in range(256) if not chr(c).isdecimal()}
+
+
+def _strip_non_digits(text: str) -> str:
+    if not text or text.isdecimal():
+        return text
+    result = text.translate(_STRIP_NON_DIGIT)
+    if result and not result.isdecimal():
+        result = _NON_DIGIT.sub("", result)
+    return result
+
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if not 1 <= month <= 12:
+        raise ValueError(f"bad month number {month}; must be 1-12")
+    if month == 2 and (year % 400 == 0 or (year % 4 == 0 and year % 100 != 0)):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
 
 class NumberSpinner(Widget):
     DEFAULT_CSS = """
@@ -55,14 +83,22 @@ class NumberSpinner(Widget):
         :keyword classes: classes for the NumberSpinner
         """
         super().__init__(**kwargs)
+        self.date_part: Optional[str] = None
         self.min = min_val
         self.max = max_val
 
+        # Small ranges such as days and months are spun constantly, so their strings are built once up front.
+        self._str_base = min_val
+        self._str_cache = tuple(str(v) for v in range(min_val, max_val + 1)) if max_val - min_val < 128 else ()
+
         value = initial_value if initial_value is not None else self.min
         input_params = dict(
             classes="num_spin_input",
             value=str(value)
         )
+        # The parsed value is cached against the input text it was parsed from, see the value property.
+        self._int_value = value
+        self._int_text = input_params["value"]
         self.input = Input(**input_params)
         if not self.number_valid():
             self.input.value = str(self.min)
@@ -89,8 +125,12 @@ class NumberSpinner(Widget):
 
     @on(Input.Changed)
     def _typed_anything(self, event: Input.Changed):
-        result = re.sub(r"\D*", "", event.value)
-        if len(event.input.value) != len(result):
+        if event.value != event.input.value:
+            # A later write has already replaced this text and will be handled (or reported) on its own.
+            return
+        text = event.input.value
+        result = _strip_non_digits(text)
+        if len(text) != len(result):
             event.input.value = result
             event.input.cursor_position -= 1
         else:
@@ -101,36 +141,54 @@ class NumberSpinner(Widget):
     @on(DescendantBlur, ".num_spin_input")
     def _leave_input(self):
         if not len(self.input.value):
-            self.input.value = self.min
+            self.set_value_no_msg(self.min)
         else:
             self.constrain_value()
 
     def constrain_value(self):
         """
-        If the internal value is outside the permitted values then it will be constrained.
+        If the internal value is outside the permitted values then it will be constrained, posting NumberChanged with
+        the constrained value.
         """
-        if not len(self.input.value):
+        if not self.input.value:
             return
-        if self.value > self.max:
-            self.set_value_no_msg(self.max)
-        if self.value < self.min:
-            self.set_value_no_msg(self.min)
+        value = self.value
+        constrained = self.min if value < self.min else self.max if value > self.max else value
+        if constrained != value:
+            self.value = constrained
         self.input.cursor_position = len(self.input.value)
 
     def set_value_no_msg(self, value: int):
-        self.input.value = str(value)
+        self._write_input(value)
+
+    def _write_input(self, value: int) -> bool:
+        """
+        Programmatic writes must not round-trip through Input.Changed, otherwise _typed_anything posts a second
+        NumberChanged for the same value. Returns False if the input already showed exactly this value.
+        """
+        index = value - self._str_base
+        text = self._str_cache[index] if 0 <= index < len(self._str_cache) else str(value)
+        if text == self.input.value:
+            return False
+        with self.prevent(Input.Changed):
+            self.input.value = text
+        self._int_value = value
+        self._int_text = text
+        return True
 
     @property
-    def value(self):
-        try:
-            return int(self.input.value)
-        except ValueError:
-            return self.min
+    def value(self) -> int:
+        text = self.input.value
+        if text != self._int_text:
+            digits = _strip_non_digits(text)
+            self._int_value = int(digits) if digits else self.min
+            self._int_text = text
+        return self._int_value
 
     @value.setter
     def value(self, value: int):
-        self.input.value = str(value)
-        self.post_message(self.NumberChanged(number_spinner=self, number=self.value))
+        if self._write_input(value):
+            self.post_message(self.NumberChanged(number_spinner=self, number=value))
 
     def number_valid(self):
         return self.min <= self.value <= self.max
@@ -163,13 +221,16 @@ class BasicDatePicker(Grid):
             super().__init__()
         self.label = label
 
-        init_day = initial_value.day if initial_value is not None else date.today().day
-        init_month = initial_value.month if initial_value is not None else date.today().month
-        init_year = initial_value.year if initial_value is not None else date.today().year
+        today = date.today()
+        initial = initial_value if initial_value is not None else today
 
-        self.day = NumberSpinner(1, 31, init_day, classes="day")
-        self.month = NumberSpinner(1, 12, init_month, classes="month")
-        self.year = NumberSpinner(min_year, date.today().year + 1, init_year, classes="year")
+        self.day = NumberSpinner(1, 31, initial.day, classes="day")
+        self.month = NumberSpinner(1, 12, initial.month, classes="month")
+        self.year = NumberSpinner(min_year, today.year + 1, initial.year, classes="year")
+        self.day.date_part = "day"
+        self.month.date_part = "month"
+        self.year.date_part = "year"
+        self._validate_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         yield Label(self.label, classes="form_label")
@@ -182,27 +243,30 @@ class BasicDatePicker(Grid):
     def highest_day(self):
         if self.month.value > 12:
             self.month.value = 12
-        return monthrange(self.year.value, self.month.value)[1]
+        return _days_in_month(self.year.value, self.month.value)
 
     @on(NumberSpinner.ButtonSpin)
     def _on_spin(self, event: NumberSpinner.ButtonSpin):
         spinner = event.number_spinner
-        if spinner.has_class("year"):
+        date_part = spinner.date_part
+        if date_part == "year":
             return
-        if spinner.has_class("month") and event.transient_number > spinner.max and self.year.value <= self.year.max:
+        is_month = date_part == "month"
+        is_day = date_part == "day"
+        if is_month and event.transient_number > spinner.max and self.year.value <= self.year.max:
             self.year.value += 1
             self.month.value = self.month.min
-        elif spinner.has_class("day") and self.month.value == 12 and event.transient_number == self.highest_day + 1:
+        elif is_day and self.month.value == 12 and event.transient_number == self.highest_day + 1:
             self.month.value = 1
             self.day.value = 1
             self.year.value += 1
-        elif spinner.has_class("month") and event.transient_number < spinner.min and self.year.value >= self.year.min:
+        elif is_month and event.transient_number < spinner.min and self.year.value >= self.year.min:
             self.year.value -= 1
             self.month.value = self.month.max
-        elif spinner.has_class("day") and event.transient_number > spinner.max and self.month.value <= self.month.max:
+        elif is_day and event.transient_number > spinner.max and self.month.value <= self.month.max:
             self.month.value += 1
             self.day.value = self.day.min
-        elif spinner.has_class("day") and event.transient_number == 0 and self.month.value == 1:
+        elif is_day and event.transient_number == 0 and self.month.value == 1:
             if self.year.value != self.year.min:
                 self.month.value = 12
                 self.year.value -= 1
@@ -210,34 +274,62 @@ class BasicDatePicker(Grid):
             else:
                 self.month.value = 1
                 self.day.value = 1
-        elif spinner.has_class("day") and event.transient_number < spinner.min and self.month.value >= self.month.min:
+        elif is_day and event.transient_number < spinner.min and self.month.value >= self.month.min:
             self.month.value -= 1
             self.day.value = self.day.max
 
     @on(NumberSpinner.NumberChanged)
     def _on_change(self, event: NumberSpinner.NumberChanged):
-        if event.number_spinner.has_class("day"):
-            date_part = "day"
-        elif event.number_spinner.has_class("month"):
-            date_part = "month"
-        else:
-            date_part = "year"
-        self.post_message(self.Changed(self, date_part, event.number))
+        self.post_message(self.Changed(self, event.number_spinner.date_part or "year", event.number))
 
     @on(NumberSpinner.NumberChanged, ".month,.year")
     def validate(self):
+        """
+        While the month or year is being typed into, the day constraint is only re-applied once typing pauses.
+        """
+        self._cancel_validate()
+        if self.month.input.has_focus or self.year.input.has_focus:
+            self._validate_timer = self.set_timer(_VALIDATE_DELAY, self._do_validate)
+        else:
+            self._do_validate()
+
+    @on(DescendantBlur)
+    def _flush_validate(self):
+        if self._validate_timer is not None:
+            self._cancel_validate()
+            self._do_validate()
+
+    def _cancel_validate(self):
+        if self._validate_timer is not None:
+            self._validate_timer.stop()
+            self._validate_timer = None
+
+    def _do_validate(self):
+        self._validate_timer = None
         self.day.max = self.highest_day
         self.day.constrain_value()
 
     @property
-    def date(self):
-        try:
-            return date(self.year.value, self.month.value, self.day.value)
-        except ValueError:
-            return None
+    def date(self) -> Optional[date]:
+        year, month, day = self.year.value, self.month.value, self.day.value
+        if MINYEAR <= year <= MAXYEAR and 1 <= month <= 12 and 1 <= day <= _days_in_month(year, month):
+            return date(year, month, day)
+        return None
 
     @date.setter
     def date(self, value: Union[date, DateTuple]):
-        self.day.value = value.day
-        self.month.value = value.month
-        self.year.value = value.year
+        """
+        All three parts are written before the day constraint is applied, so e.g. moving from 31 Jan to 29 Feb does
+        not clamp the day against the old month. A Changed message is posted for each part that actually changed.
+        """
+        previous = (self.year.value, self.month.value, self.day.value)
+        self._cancel_validate()
+        self.year.set_value_no_msg(value.year)
+        self.month.set_value_no_msg(value.month)
+        day = self.day
+        day.max = self.highest_day
+        day.set_value_no_msg(day.min if value.day < day.min else day.max if value.day > day.max else value.day)
+        for date_part, old, new in zip(("year", "month", "day"), previous,
+                                       (self.year.value, self.month.value, self.day.value)):
+            if old != new:
+                self.post_message(self.Changed(self, date_part, new))